@@ -1,16 +1,47 @@
 from enum import Enum
-from typing import Any, List, Type, cast
+from functools import lru_cache
+from operator import itemgetter
+from string import Formatter
+from typing import Callable, Dict, List, Optional, Tuple, Type
 
 from tortoise import BaseDBAsyncClient, Model
 from tortoise.backends.base.schema_generator import BaseSchemaGenerator
-from tortoise.backends.sqlite.schema_generator import SqliteSchemaGenerator
 
 from aerich.utils import is_default_function
 
+# field types whose default is never rendered into the column definition
+_NO_DB_DEFAULT_FIELD_TYPES = frozenset(("UUIDField", "TextField", "JSONField"))
+# keys fetched together from fk and m2m field describes
+_FK_ITEMS = itemgetter("raw_field", "on_delete")
+_M2M_ITEMS = itemgetter("through", "backward_key", "forward_key", "on_delete", "description")
+
+
+@lru_cache(maxsize=256)
+def _compile_template(template: str) -> Callable[..., str]:
+    """
+    compile a str.format style template into a function built around an equivalent f-string,
+    cached so each distinct template is parsed only once.
+    templates should use named fields only, e.g. `{table_name}`; templates with positional,
+    attribute or index fields, or with nested fields in a format spec, fall back to str.format
+    :param template:
+    :return:
+    """
+    fields = set()
+    for _, name, format_spec, _ in Formatter().parse(template):
+        if name is None:
+            continue
+        if not name.isidentifier() or "{" in (format_spec or ""):
+            return template.format
+        fields.add(name)
+    params = ", ".join([*sorted(fields), "**_"])
+    return eval(f"lambda {params}: f{template!r}")  # nosec B307
+
 
 class BaseDDL:
     schema_generator_cls: Type[BaseSchemaGenerator] = BaseSchemaGenerator
     DIALECT = "sql"
+    # whether a column can be added with a UNIQUE constraint by ALTER TABLE
+    _SUPPORTS_ADD_UNIQUE = True
     _DROP_TABLE_TEMPLATE = 'DROP TABLE IF EXISTS "{table_name}"'
     _ADD_COLUMN_TEMPLATE = 'ALTER TABLE "{table_name}" ADD {column}'
     _DROP_COLUMN_TEMPLATE = 'ALTER TABLE "{table_name}" DROP COLUMN "{column_name}"'
@@ -35,10 +66,13 @@ class BaseDDL:
         'ALTER TABLE "{table_name}" CHANGE {old_column_name} {new_column_name} {new_column_type}'
     )
     _RENAME_TABLE_TEMPLATE = 'ALTER TABLE "{old_table_name}" RENAME TO "{new_table_name}"'
+    _render = staticmethod(_compile_template)
 
     def __init__(self, client: "BaseDBAsyncClient") -> None:
         self.client = client
         self.schema_generator = self.schema_generator_cls(client)
+        self._fk_name_cache: Dict[Tuple[str, str, str, str], str] = {}
+        self._index_name_cache: Dict[Tuple[str, str, Tuple[str, ...]], str] = {}
 
     def create_table(self, model: "Type[Model]") -> str:
         return self.schema_generator._get_table_sql(model, True)["table_creation_string"].rstrip(
@@ -46,99 +80,94 @@ class BaseDDL:
         )
 
     def drop_table(self, table_name: str) -> str:
-        return self._DROP_TABLE_TEMPLATE.format(table_name=table_name)
+        return self._render(self._DROP_TABLE_TEMPLATE)(table_name=table_name)
 
     def create_m2m(
         self, model: "Type[Model]", field_describe: dict, reference_table_describe: dict
     ) -> str:
-        through = cast(str, field_describe.get("through"))
-        description = field_describe.get("description")
-        pk_field = cast(dict, reference_table_describe.get("pk_field"))
-        reference_id = pk_field.get("db_column")
-        db_field_types = cast(dict, pk_field.get("db_field_types"))
-        return self._M2M_TABLE_TEMPLATE.format(
+        schema_generator = self.schema_generator
+        meta = model._meta
+        through, backward_key, forward_key, on_delete, description = _M2M_ITEMS(field_describe)
+        pk_field = reference_table_describe["pk_field"]
+        db_field_types = pk_field["db_field_types"]
+        return self._render(self._M2M_TABLE_TEMPLATE)(
             table_name=through,
-            backward_table=model._meta.db_table,
+            backward_table=meta.db_table,
             forward_table=reference_table_describe.get("table"),
-            backward_field=model._meta.db_pk_column,
-            forward_field=reference_id,
-            backward_key=field_describe.get("backward_key"),
-            backward_type=model._meta.pk.get_for_dialect(self.DIALECT, "SQL_TYPE"),
-            forward_key=field_describe.get("forward_key"),
+            backward_field=meta.db_pk_column,
+            forward_field=pk_field.get("db_column"),
+            backward_key=backward_key,
+            backward_type=meta.pk.get_for_dialect(self.DIALECT, "SQL_TYPE"),
+            forward_key=forward_key,
             forward_type=db_field_types.get(self.DIALECT) or db_field_types.get(""),
-            on_delete=field_describe.get("on_delete"),
-            extra=self.schema_generator._table_generate_extra(table=through),
+            on_delete=on_delete,
+            extra=schema_generator._table_generate_extra(table=through),
             comment=(
-                self.schema_generator._table_comment_generator(table=through, comment=description)
+                schema_generator._table_comment_generator(table=through, comment=description)
                 if description
                 else ""
             ),
         )
 
     def drop_m2m(self, table_name: str) -> str:
-        return self._DROP_TABLE_TEMPLATE.format(table_name=table_name)
+        return self._render(self._DROP_TABLE_TEMPLATE)(table_name=table_name)
 
-    def _get_default(self, model: "Type[Model]", field_describe: dict) -> Any:
-        db_table = model._meta.db_table
-        default = field_describe.get("default")
+    def _get_default(self, model: "Type[Model]", field_describe: dict) -> Optional[str]:
+        get = field_describe.get
+        default = get("default")
+        auto_now_add = get("auto_now_add", False)
+        if default is None and not auto_now_add:
+            return None
         if isinstance(default, Enum):
             default = default.value
-        db_column = cast(str, field_describe.get("db_column"))
-        auto_now_add = field_describe.get("auto_now_add", False)
-        auto_now = field_describe.get("auto_now", False)
-        if default is not None or auto_now_add:
-            if field_describe.get("field_type") in [
-                "UUIDField",
-                "TextField",
-                "JSONField",
-            ] or is_default_function(default):
-                default = ""
-            else:
-                try:
-                    default = self.schema_generator._column_default_generator(
-                        db_table,
-                        db_column,
-                        self.schema_generator._escape_default_value(default),
-                        auto_now_add,
-                        auto_now,
-                    )
-                except NotImplementedError:
-                    default = ""
-        else:
-            default = None
-        return default
+        if get("field_type") in _NO_DB_DEFAULT_FIELD_TYPES or (
+            # only functions and their serialized names can be default functions
+            (callable(default) or isinstance(default, str))
+            and is_default_function(default)
+        ):
+            return ""
+        schema_generator = self.schema_generator
+        try:
+            return schema_generator._column_default_generator(
+                model._meta.db_table,
+                field_describe["db_column"],
+                schema_generator._escape_default_value(default),
+                auto_now_add,
+                get("auto_now", False),
+            )
+        except NotImplementedError:
+            return ""
 
     def add_column(self, model: "Type[Model]", field_describe: dict, is_pk: bool = False) -> str:
         return self._add_or_modify_column(model, field_describe, is_pk)
 
-    def _add_or_modify_column(self, model, field_describe: dict, is_pk: bool, modify=False) -> str:
+    def _add_or_modify_column(
+        self, model: "Type[Model]", field_describe: dict, is_pk: bool, modify: bool = False
+    ) -> str:
+        get = field_describe.get
+        schema_generator = self.schema_generator
         db_table = model._meta.db_table
-        description = field_describe.get("description")
-        db_column = cast(str, field_describe.get("db_column"))
-        db_field_types = cast(dict, field_describe.get("db_field_types"))
+        description = get("description")
+        db_column = field_describe["db_column"]
+        db_field_types = field_describe["db_field_types"]
         default = self._get_default(model, field_describe)
         if default is None:
             default = ""
         if modify:
             unique = ""
-            template = self._MODIFY_COLUMN_TEMPLATE
+            render = self._render(self._MODIFY_COLUMN_TEMPLATE)
         else:
-            # sqlite does not support alter table to add unique column
-            unique = (
-                "UNIQUE"
-                if field_describe.get("unique") and self.DIALECT != SqliteSchemaGenerator.DIALECT
-                else ""
-            )
-            template = self._ADD_COLUMN_TEMPLATE
-        return template.format(
+            unique = "UNIQUE" if get("unique") and self._SUPPORTS_ADD_UNIQUE else ""
+            render = self._render(self._ADD_COLUMN_TEMPLATE)
+        return render(
             table_name=db_table,
-            column=self.schema_generator._create_string(
+            column=schema_generator._create_string(
                 db_column=db_column,
                 field_type=db_field_types.get(self.DIALECT, db_field_types.get("")),
-                nullable="NOT NULL" if not field_describe.get("nullable") else "",
+                nullable="NOT NULL" if not get("nullable") else "",
                 unique=unique,
                 comment=(
-                    self.schema_generator._column_comment_generator(
+                    schema_generator._column_comment_generator(
                         table=db_table,
                         column=db_column,
                         comment=description,
@@ -152,7 +181,7 @@ class BaseDDL:
         )
 
     def drop_column(self, model: "Type[Model]", column_name: str) -> str:
-        return self._DROP_COLUMN_TEMPLATE.format(
+        return self._render(self._DROP_COLUMN_TEMPLATE)(
             table_name=model._meta.db_table, column_name=column_name
         )
 
@@ -162,7 +191,7 @@ class BaseDDL:
     def rename_column(
         self, model: "Type[Model]", old_column_name: str, new_column_name: str
     ) -> str:
-        return self._RENAME_COLUMN_TEMPLATE.format(
+        return self._render(self._RENAME_COLUMN_TEMPLATE)(
             table_name=model._meta.db_table,
             old_column_name=old_column_name,
             new_column_name=new_column_name,
@@ -171,67 +200,80 @@ class BaseDDL:
     def change_column(
         self, model: "Type[Model]", old_column_name: str, new_column_name: str, new_column_type: str
     ) -> str:
-        return self._CHANGE_COLUMN_TEMPLATE.format(
+        return self._render(self._CHANGE_COLUMN_TEMPLATE)(
             table_name=model._meta.db_table,
             old_column_name=old_column_name,
             new_column_name=new_column_name,
             new_column_type=new_column_type,
         )
 
-    def add_index(self, model: "Type[Model]", field_names: List[str], unique=False) -> str:
-        return self._ADD_INDEX_TEMPLATE.format(
+    def _generate_index_name(
+        self, prefix: str, model: "Type[Model]", field_names: List[str]
+    ) -> str:
+        """Generate index name, memoized per (prefix, table, field_names)"""
+        key = (prefix, model._meta.db_table, tuple(field_names))
+        try:
+            return self._index_name_cache[key]
+        except KeyError:
+            index_name = self.schema_generator._generate_index_name(prefix, model, field_names)
+            self._index_name_cache[key] = index_name
+            return index_name
+
+    def add_index(self, model: "Type[Model]", field_names: List[str], unique: bool = False) -> str:
+        return self._render(self._ADD_INDEX_TEMPLATE)(
             unique="UNIQUE " if unique else "",
-            index_name=self.schema_generator._generate_index_name(
-                "idx" if not unique else "uid", model, field_names
-            ),
+            index_name=self._generate_index_name("uid" if unique else "idx", model, field_names),
             table_name=model._meta.db_table,
-            column_names=", ".join(self.schema_generator.quote(f) for f in field_names),
+            column_names=", ".join(map(self.schema_generator.quote, field_names)),
         )
 
-    def drop_index(self, model: "Type[Model]", field_names: List[str], unique=False) -> str:
-        return self._DROP_INDEX_TEMPLATE.format(
-            index_name=self.schema_generator._generate_index_name(
-                "idx" if not unique else "uid", model, field_names
-            ),
+    def drop_index(self, model: "Type[Model]", field_names: List[str], unique: bool = False) -> str:
+        return self._render(self._DROP_INDEX_TEMPLATE)(
+            index_name=self._generate_index_name("uid" if unique else "idx", model, field_names),
             table_name=model._meta.db_table,
         )
 
     def drop_index_by_name(self, model: "Type[Model]", index_name: str) -> str:
-        return self._DROP_INDEX_TEMPLATE.format(
+        return self._render(self._DROP_INDEX_TEMPLATE)(
             index_name=index_name,
             table_name=model._meta.db_table,
         )
 
     def _generate_fk_name(
-        self, db_table, field_describe: dict, reference_table_describe: dict
+        self, db_table: str, field_describe: dict, reference_table_describe: dict
     ) -> str:
-        """Generate fk name"""
-        db_column = cast(str, field_describe.get("raw_field"))
-        pk_field = cast(dict, reference_table_describe.get("pk_field"))
-        to_field = cast(str, pk_field.get("db_column"))
-        to_table = cast(str, reference_table_describe.get("table"))
-        return self.schema_generator._generate_fk_name(
-            from_table=db_table,
-            from_field=db_column,
-            to_table=to_table,
-            to_field=to_field,
-        )
+        """Generate fk name, memoized per (from_table, from_field, to_table, to_field)"""
+        db_column = field_describe["raw_field"]
+        pk_field = reference_table_describe["pk_field"]
+        to_field = pk_field["db_column"]
+        to_table = reference_table_describe["table"]
+        key = (db_table, db_column, to_table, to_field)
+        try:
+            return self._fk_name_cache[key]
+        except KeyError:
+            fk_name = self.schema_generator._generate_fk_name(
+                from_table=db_table,
+                from_field=db_column,
+                to_table=to_table,
+                to_field=to_field,
+            )
+            self._fk_name_cache[key] = fk_name
+            return fk_name
 
     def add_fk(
         self, model: "Type[Model]", field_describe: dict, reference_table_describe: dict
     ) -> str:
         db_table = model._meta.db_table
-
-        db_column = field_describe.get("raw_field")
-        pk_field = cast(dict, reference_table_describe.get("pk_field"))
+        db_column, on_delete = _FK_ITEMS(field_describe)
+        pk_field = reference_table_describe["pk_field"]
         reference_id = pk_field.get("db_column")
-        return self._ADD_FK_TEMPLATE.format(
+        return self._render(self._ADD_FK_TEMPLATE)(
             table_name=db_table,
             fk_name=self._generate_fk_name(db_table, field_describe, reference_table_describe),
             db_column=db_column,
             table=reference_table_describe.get("table"),
             field=reference_id,
-            on_delete=field_describe.get("on_delete"),
+            on_delete=on_delete,
         )
 
     def drop_fk(
@@ -239,15 +281,16 @@ class BaseDDL:
     ) -> str:
         db_table = model._meta.db_table
         fk_name = self._generate_fk_name(db_table, field_describe, reference_table_describe)
-        return self._DROP_FK_TEMPLATE.format(table_name=db_table, fk_name=fk_name)
+        return self._render(self._DROP_FK_TEMPLATE)(table_name=db_table, fk_name=fk_name)
 
     def alter_column_default(self, model: "Type[Model]", field_describe: dict) -> str:
         db_table = model._meta.db_table
         default = self._get_default(model, field_describe)
-        return self._ALTER_DEFAULT_TEMPLATE.format(
+        return self._render(self._ALTER_DEFAULT_TEMPLATE)(
             table_name=db_table,
             column=field_describe.get("db_column"),
-            default="SET" + default if default is not None else "DROP DEFAULT",
+            # default is either empty or rendered with a leading space, e.g. " DEFAULT 0"
+            default=f"SET{default}" if default else "DROP DEFAULT",
         )
 
     def alter_column_null(self, model: "Type[Model]", field_describe: dict) -> str:
@@ -258,6 +301,6 @@ class BaseDDL:
 
     def rename_table(self, model: "Type[Model]", old_table_name: str, new_table_name: str) -> str:
         db_table = model._meta.db_table
-        return self._RENAME_TABLE_TEMPLATE.format(
+        return self._render(self._RENAME_TABLE_TEMPLATE)(
             table_name=db_table, old_table_name=old_table_name, new_table_name=new_table_name
         )
@@ -46,18 +46,18 @@ class MysqlDDL(BaseDDL):
             index_prefix = "uid"
         else:
             index_prefix = "idx"
-        return self.schema_generator._generate_index_name(index_prefix, model, field_names)
+        return self._generate_index_name(index_prefix, model, field_names)
 
-    def add_index(self, model: "Type[Model]", field_names: List[str], unique=False) -> str:
-        return self._ADD_INDEX_TEMPLATE.format(
+    def add_index(self, model: "Type[Model]", field_names: List[str], unique: bool = False) -> str:
+        return self._render(self._ADD_INDEX_TEMPLATE)(
             unique="UNIQUE " if unique else "",
             index_name=self._index_name(unique, model, field_names),
             table_name=model._meta.db_table,
-            column_names=", ".join(self.schema_generator.quote(f) for f in field_names),
+            column_names=", ".join(map(self.schema_generator.quote, field_names)),
         )
 
-    def drop_index(self, model: "Type[Model]", field_names: List[str], unique=False) -> str:
-        return self._DROP_INDEX_TEMPLATE.format(
+    def drop_index(self, model: "Type[Model]", field_names: List[str], unique: bool = False) -> str:
+        return self._render(self._DROP_INDEX_TEMPLATE)(
             index_name=self._index_name(unique, model, field_names),
             table_name=model._meta.db_table,
         )
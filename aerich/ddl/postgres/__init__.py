@@ -1,4 +1,4 @@
-from typing import Type, cast
+from typing import Type
 
 from tortoise import Model
 from tortoise.backends.asyncpg.schema_generator import AsyncpgSchemaGenerator
@@ -20,7 +20,7 @@ class PostgresDDL(BaseDDL):
 
     def alter_column_null(self, model: "Type[Model]", field_describe: dict) -> str:
         db_table = model._meta.db_table
-        return self._ALTER_NULL_TEMPLATE.format(
+        return self._render(self._ALTER_NULL_TEMPLATE)(
             table_name=db_table,
             column=field_describe.get("db_column"),
             set_drop="DROP" if field_describe.get("nullable") else "SET",
@@ -28,10 +28,10 @@ class PostgresDDL(BaseDDL):
 
     def modify_column(self, model: "Type[Model]", field_describe: dict, is_pk: bool = False) -> str:
         db_table = model._meta.db_table
-        db_field_types = cast(dict, field_describe.get("db_field_types"))
+        db_field_types = field_describe["db_field_types"]
         db_column = field_describe.get("db_column")
         datatype = db_field_types.get(self.DIALECT) or db_field_types.get("")
-        return self._MODIFY_COLUMN_TEMPLATE.format(
+        return self._render(self._MODIFY_COLUMN_TEMPLATE)(
             table_name=db_table,
             column=db_column,
             datatype=datatype,
@@ -40,7 +40,7 @@ class PostgresDDL(BaseDDL):
 
     def set_comment(self, model: "Type[Model]", field_describe: dict) -> str:
         db_table = model._meta.db_table
-        return self._SET_COMMENT_TEMPLATE.format(
+        return self._render(self._SET_COMMENT_TEMPLATE)(
             table_name=db_table,
             column=field_describe.get("db_column") or field_describe.get("raw_field"),
             comment=(
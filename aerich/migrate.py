@@ -28,6 +28,36 @@ async def downgrade(db: BaseDBAsyncClient) -> str:
         {downgrade_sql}\"\"\"
 """
 
+_DDL_CLASSES: Dict[str, Type[BaseDDL]] = {}
+# Attribute set on the (tortoise-owned) client to hold its ddl. The client -> ddl -> client
+# reference cycle is intended: both are collected together once the client is unreachable,
+# which a mapping keyed by client cannot provide as its values keep the keys alive.
+_CLIENT_DDL_ATTR = "_aerich_ddl"
+
+
+def _get_ddl_class(dialect: str) -> Type[BaseDDL]:
+    try:
+        return _DDL_CLASSES[dialect]
+    except KeyError:
+        # dialect modules are imported lazily, as they need the optional db drivers
+        ddl_dialect_module = importlib.import_module(f"aerich.ddl.{dialect}")
+        ddl_class = getattr(ddl_dialect_module, f"{dialect.capitalize()}DDL")
+        _DDL_CLASSES[dialect] = ddl_class
+        return ddl_class
+
+
+def get_ddl(client: BaseDBAsyncClient) -> BaseDDL:
+    """
+    get ddl of the client dialect, one instance is kept per client
+    :param client:
+    :return:
+    """
+    ddl: Optional[BaseDDL] = getattr(client, _CLIENT_DDL_ATTR, None)
+    if ddl is None:
+        ddl = _get_ddl_class(client.schema_generator.DIALECT)(client)
+        setattr(client, _CLIENT_DDL_ATTR, ddl)
+    return ddl
+
 
 class Migrate:
     upgrade_operators: List[str] = []
@@ -85,11 +115,6 @@ class Migrate:
             ret = await connection.execute_query(sql)
             cls._db_version = ret[1][0].get("version")
 
-    @classmethod
-    async def load_ddl_class(cls) -> Type[BaseDDL]:
-        ddl_dialect_module = importlib.import_module(f"aerich.ddl.{cls.dialect}")
-        return getattr(ddl_dialect_module, f"{cls.dialect.capitalize()}DDL")
-
     @classmethod
     async def init(cls, config: dict, app: str, location: str) -> None:
         await Tortoise.init(config=config)
@@ -101,8 +126,8 @@ class Migrate:
 
         connection = get_app_connection(config, app)
         cls.dialect = connection.schema_generator.DIALECT
-        cls.ddl_class = await cls.load_ddl_class()
-        cls.ddl = cls.ddl_class(connection)
+        cls.ddl = get_ddl(connection)
+        cls.ddl_class = type(cls.ddl)
         await cls._get_db_version(connection)
 
     @classmethod
@@ -4,7 +4,7 @@ import re
 import sys
 from pathlib import Path
 from types import ModuleType
-from typing import Dict, Optional, Union
+from typing import Any, Dict, Optional, Union
 
 from asyncclick import BadOptionUsage, ClickException, Context
 from tortoise import BaseDBAsyncClient, Tortoise
@@ -91,7 +91,7 @@ def get_models_describe(app: str) -> Dict:
     return ret
 
 
-def is_default_function(string: str) -> Optional[re.Match]:
+def is_default_function(string: Any) -> Optional[re.Match]:
     return re.match(r"^<function.+>$", str(string or ""))
 
 
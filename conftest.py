@@ -1,19 +1,12 @@
 import asyncio
-import contextlib
 import os
 from typing import Generator
 
 import pytest
 from tortoise import Tortoise, expand_db_url, generate_schema_for_client
-from tortoise.backends.asyncpg.schema_generator import AsyncpgSchemaGenerator
-from tortoise.backends.mysql.schema_generator import MySQLSchemaGenerator
-from tortoise.backends.sqlite.schema_generator import SqliteSchemaGenerator
-from tortoise.exceptions import DBConnectionError, OperationalError
+from tortoise.exceptions import OperationalError
 
-from aerich.ddl.mysql import MysqlDDL
-from aerich.ddl.postgres import PostgresDDL
-from aerich.ddl.sqlite import SqliteDDL
-from aerich.migrate import Migrate
+from aerich.migrate import Migrate, get_ddl
 
 MEMORY_SQLITE = "sqlite://:memory:"
 db_url = os.getenv("TEST_DB", MEMORY_SQLITE)
@@ -55,20 +48,23 @@ def event_loop() -> Generator:
 
 @pytest.fixture(scope="session", autouse=True)
 async def initialize_tests(event_loop, request) -> None:
-    # Placing init outside the try block since it doesn't
-    # establish connections to the DB eagerly.
-    await Tortoise.init(config=tortoise_orm)
-    with contextlib.suppress(DBConnectionError, OperationalError):
-        await Tortoise._drop_databases()
-    await Tortoise.init(config=tortoise_orm, _create_db=True)
+    if db_url == db_url_second == MEMORY_SQLITE:
+        # In-memory databases start empty and vanish with their connection,
+        # so there is nothing to create beforehand or to drop afterwards.
+        await Tortoise.init(config=tortoise_orm)
+        teardown = Tortoise.close_connections
+    else:
+        try:
+            await Tortoise.init(config=tortoise_orm, _create_db=True)
+        except OperationalError:
+            # Databases are left over from an aborted session, drop and create them again.
+            # The plain init is needed as _drop_databases refuses to run after a failed init.
+            await Tortoise.init(config=tortoise_orm)
+            await Tortoise._drop_databases()
+            await Tortoise.init(config=tortoise_orm, _create_db=True)
+        teardown = Tortoise._drop_databases
     await generate_schema_for_client(Tortoise.get_connection("default"), safe=True)
 
-    client = Tortoise.get_connection("default")
-    if client.schema_generator is MySQLSchemaGenerator:
-        Migrate.ddl = MysqlDDL(client)
-    elif client.schema_generator is SqliteSchemaGenerator:
-        Migrate.ddl = SqliteDDL(client)
-    elif client.schema_generator is AsyncpgSchemaGenerator:
-        Migrate.ddl = PostgresDDL(client)
+    Migrate.ddl = get_ddl(Tortoise.get_connection("default"))
     Migrate.dialect = Migrate.ddl.DIALECT
-    request.addfinalizer(lambda: event_loop.run_until_complete(Tortoise._drop_databases()))
+    request.addfinalizer(lambda: event_loop.run_until_complete(teardown()))
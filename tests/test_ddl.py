@@ -57,6 +57,18 @@ def test_drop_table():
         assert ret == 'DROP TABLE IF EXISTS "category"'
 
 
+def test_template_reassigned_after_class_creation():
+    class DDL(type(Migrate.ddl)):
+        pass
+
+    ddl = DDL(Migrate.ddl.client)
+    DDL._DROP_TABLE_TEMPLATE = 'DROP TABLE "{table_name}" CASCADE'
+    assert ddl.drop_table("category") == 'DROP TABLE "category" CASCADE'
+    # fields f-strings cannot express are still rendered by str.format
+    DDL._DROP_TABLE_TEMPLATE = 'DROP TABLE "{table_name}" -- {table_name[0]}'
+    assert ddl.drop_table("category") == 'DROP TABLE "category" -- c'
+
+
 def test_add_column():
     ret = Migrate.ddl.add_column(Category, Category._meta.fields_map.get("name").describe(False))
     if isinstance(Migrate.ddl, MysqlDDL):
@@ -128,6 +140,13 @@ def test_alter_column_default():
     elif isinstance(Migrate.ddl, MysqlDDL):
         assert ret == "ALTER TABLE `product` ALTER COLUMN `view_num` SET DEFAULT 0"
 
+    # defaults of text fields are not rendered by the database
+    ret = Migrate.ddl.alter_column_default(User, User._meta.fields_map.get("intro").describe(True))
+    if isinstance(Migrate.ddl, PostgresDDL):
+        assert ret == 'ALTER TABLE "user" ALTER COLUMN "intro" DROP DEFAULT'
+    elif isinstance(Migrate.ddl, MysqlDDL):
+        assert ret == "ALTER TABLE `user` ALTER COLUMN `intro` DROP DEFAULT"
+
 
 def test_alter_column_null():
     if isinstance(Migrate.ddl, (SqliteDDL, MysqlDDL)):
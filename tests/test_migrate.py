@@ -1,14 +1,17 @@
+import gc
+import weakref
 from pathlib import Path
 
 import pytest
 import tortoise
 from pytest_mock import MockerFixture
+from tortoise.backends.sqlite import SqliteClient
 
 from aerich.ddl.mysql import MysqlDDL
 from aerich.ddl.postgres import PostgresDDL
 from aerich.ddl.sqlite import SqliteDDL
 from aerich.exceptions import NotSupportError
-from aerich.migrate import MIGRATE_TEMPLATE, Migrate
+from aerich.migrate import MIGRATE_TEMPLATE, Migrate, get_ddl
 from aerich.utils import get_models_describe
 
 # tortoise-orm>=0.21 changes IntField constraints
@@ -1078,6 +1081,21 @@ def test_sort_files_containing_non_migrations(mocker):
     ]
 
 
+def test_get_ddl():
+    client = Migrate.ddl.client
+    ddl = get_ddl(client)
+    assert ddl is Migrate.ddl
+    assert get_ddl(client) is ddl
+
+    # the ddl does not keep its client alive
+    client = SqliteClient(file_path=":memory:", connection_name="test_get_ddl")
+    client_ref = weakref.ref(client)
+    get_ddl(client)
+    del client
+    gc.collect()
+    assert client_ref() is None
+
+
 async def test_empty_migration(mocker, tmp_path: Path) -> None:
     mocker.patch("os.listdir", return_value=[])
     Migrate.app = "foo"